@@ -2,40 +2,170 @@ import os
 import sys
 import time
 import socket
+import select
 import shutil
 import subprocess
+import tempfile
 import json
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from typing import Optional
 
 import click
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 
 from PyQt5 import QtCore, QtWidgets, QtGui
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 IPC_SOCKET_PATH = "/tmp/mpvsocket"
 
 
+def _json_dumps(obj) -> bytes:
+    """Encode to JSON bytes; orjson emits bytes directly and is ~5x faster."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_response(data: dict, status: int = 200) -> Response:
+    """Build a JSON response directly, bypassing Flask's jsonify machinery."""
+    return Response(_json_dumps(data), status=status, mimetype='application/json')
+
+
+_MPV_PATH: Optional[str] = None
+
+# Flags shared by the embedded player and the fullscreen interrupt-ad
+# instance; per-instance flags are appended at the call sites
+_MPV_COMMON = (
+    "--keep-open=no",
+    "--idle=no",
+    "--no-osd-bar",  # Hide OSD bar
+    "--no-input-default-bindings",  # Disable default key bindings
+    "--no-input-vo-keyboard",  # Disable keyboard input
+    # Force x11 VO and disable hwdec overlays so Qt overlays stay on top
+    "--vo=x11",
+    "--hwdec=no",
+)
+
+_MPV_CONF_PATH: Optional[str] = None
+
+
+def _mpv_common_args() -> tuple:
+    """Return the shared flags, preferring a --include config file.
+
+    The config file is written once per process; mpv parses it faster
+    than a long argv and both launch sites shrink to one option. Falls
+    back to the raw flag tuple if the file cannot be written.
+    """
+    global _MPV_CONF_PATH
+    if _MPV_CONF_PATH is None:
+        lines = []
+        for flag in _MPV_COMMON:
+            opt = flag[2:]
+            # config-file syntax has no "--no-x" form; spell it "x=no"
+            if opt.startswith("no-") and "=" not in opt:
+                opt = f"{opt[3:]}=no"
+            lines.append(opt)
+        path = os.path.join(tempfile.gettempdir(), f"mpv-kiosk-{os.getpid()}.conf")
+        try:
+            with open(path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            return _MPV_COMMON
+        _MPV_CONF_PATH = path
+    return (f"--include={_MPV_CONF_PATH}",)
+
+
+def _resolve_mpv() -> Optional[str]:
+    """Resolve the mpv binary once; which() walks every $PATH entry."""
+    global _MPV_PATH
+    if _MPV_PATH is None:
+        _MPV_PATH = shutil.which("mpv")
+    return _MPV_PATH
+
+
+def _wait_for_exit(process: subprocess.Popen, timeout_s: Optional[float] = None) -> bool:
+    """Wait for a child process to exit; returns True if it did.
+
+    Uses pidfd_open + poll on Linux >= 5.3 so the kernel wakes us exactly
+    when the child exits; falls back to Popen.wait elsewhere.
+    """
+    try:
+        fd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        fd = -1
+    if fd >= 0:
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            timeout_ms = None if timeout_s is None else int(timeout_s * 1000)
+            if not poller.poll(timeout_ms):
+                return False
+        finally:
+            os.close(fd)
+        process.poll()  # reap the child now that the pidfd is readable
+        return True
+    try:
+        process.wait(timeout=timeout_s)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
+
+
 class MpvProcessManager(QtCore.QObject):
     """
     Manages the lifecycle of the mpv process embedded into a given window id.
     """
 
+    # Pre-encoded payloads for the fixed command set, so the hot path is a
+    # bare sendall with no json.dumps/encode per call
+    _PAYLOAD_PAUSE_TOGGLE = b'{"command": ["cycle", "pause"]}\n'
+    _PAYLOAD_NEXT = b'{"command": ["playlist_next"]}\n'
+    _PAYLOAD_PREV = b'{"command": ["playlist_prev"]}\n'
+    _PAYLOAD_PAUSE_ON = b'{"command": ["set", "pause", true]}\n'
+    _PAYLOAD_PAUSE_OFF = b'{"command": ["set", "pause", false]}\n'
+    _PAYLOAD_MUTE_ON = b'{"command": ["set", "mute", true]}\n'
+    _PAYLOAD_MUTE_OFF = b'{"command": ["set", "mute", false]}\n'
+    _PAYLOAD_QUIT = b'{"command": ["quit"]}\n'
+
+    # Immutable player-specific mpv flags; the shared set comes from
+    # _mpv_common_args() and the wid/IPC path/media dir vary per start
+    _STATIC_ARGS = (
+        "--save-position-on-quit=yes",
+        "--no-input-cursor",  # Disable cursor input
+        "--cursor-autohide=no",  # Keep cursor hidden
+    )
+
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
         self._process: Optional[subprocess.Popen] = None
         self._ipc_path: str = IPC_SOCKET_PATH
+        # Long-lived IPC connection, created lazily and reused across commands
+        self._ipc_sock: Optional[socket.socket] = None
+        self._ipc_lock = threading.Lock()
+        # Single sender thread owning the socket writes: serializes sends
+        # and bounds how long an HTTP worker can block on a stuck mpv
+        self._ipc_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mpv-ipc')
 
     def _cleanup_ipc_socket(self) -> None:
+        # Unconditional unlink: one syscall instead of stat + remove, and
+        # no TOCTOU window against a racing mpv instance
         try:
-            if os.path.exists(self._ipc_path):
-                os.remove(self._ipc_path)
-        except Exception:
+            os.unlink(self._ipc_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
             pass
 
     def start(self, wid: int, media_dir: str) -> None:
-        if not shutil.which("mpv"):
+        mpv_path = _resolve_mpv()
+        if not mpv_path:
             raise RuntimeError("mpv is not installed or not in PATH")
         if not os.path.isdir(media_dir):
             raise RuntimeError(f"Media directory does not exist: {media_dir}")
@@ -43,84 +173,153 @@ class MpvProcessManager(QtCore.QObject):
         self._cleanup_ipc_socket()
 
         args = [
-            "mpv",
+            mpv_path,
             media_dir,
             f"--wid={wid}",
-            "--save-position-on-quit=yes",
             f"--input-ipc-server={self._ipc_path}",
-            "--keep-open=no",
-            "--idle=no",
-            "--no-osd-bar",  # Hide OSD bar
-            "--no-input-default-bindings",  # Disable default key bindings
-            "--no-input-vo-keyboard",  # Disable keyboard input
-            "--no-input-cursor",  # Disable cursor input
-            "--cursor-autohide=no",  # Keep cursor hidden
-            # Force GPU VO and disable hwdec overlays so Qt overlays stay on top
-            "--vo=x11",
-            "--hwdec=no",
+            *self._STATIC_ARGS,
+            *_mpv_common_args(),
         ]
 
-        # Launch mpv detached but tracked by this process
+        # Launch mpv detached but tracked by this process. close_fds=False
+        # lets CPython use the posix_spawn fast path instead of forking the
+        # whole Qt+Flask process; nothing we hold open is sensitive to leak
+        # into a local mpv.
         self._process = subprocess.Popen(
             args,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
             stdin=subprocess.DEVNULL,
-            close_fds=True,
+            close_fds=False,
         )
 
-    def _send_ipc_command(self, command: list, timeout_s: float = 1.5) -> bool:
-        """Send a command to MPV via IPC socket"""
-        if not os.path.exists(self._ipc_path):
-            return False
+    def connect_ipc(self) -> bool:
+        """Eagerly establish the persistent IPC connection.
+
+        Called once mpv's socket appears so the first REST command does
+        not pay the connect cost.
+        """
+        with self._ipc_lock:
+            return self._get_ipc_sock() is not None
+
+    def _get_ipc_sock(self, timeout_s: float = 1.5) -> Optional[socket.socket]:
+        """Return the cached IPC socket, connecting lazily on first use.
+
+        Must be called with self._ipc_lock held.
+        """
+        if self._ipc_sock is not None:
+            return self._ipc_sock
+        # No exists() pre-check: connect() reports a missing socket itself,
+        # so probing first would just add a stat per reconnect
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout_s)
-                s.connect(self._ipc_path)
-                payload = json.dumps({"command": command}).encode("utf-8") + b'\n'
-                s.sendall(payload)
-                return True
+            s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            s.settimeout(timeout_s)
+            # Generous send buffer so our short JSON lines never hit wmem
+            # pressure and sendall completes in a single write
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024)
+            s.connect(self._ipc_path)
         except Exception:
+            return None
+        self._ipc_sock = s
+        return s
+
+    def _drop_ipc_sock(self) -> None:
+        """Close and forget the cached IPC socket (called on send errors)."""
+        if self._ipc_sock is not None:
+            try:
+                self._ipc_sock.close()
+            except Exception:
+                pass
+            self._ipc_sock = None
+
+    def _send_raw(self, payload: bytes, timeout_s: float = 1.5) -> bool:
+        """Queue an IPC write on the sender thread and wait briefly.
+
+        A wedged mpv can stall a write for the full socket timeout; the
+        0.25 s cap keeps API tail latency bounded. On expiry the send is
+        left queued (it still reaches mpv if it recovers) and the caller
+        gets False.
+        """
+        future = self._ipc_exec.submit(self._do_send, payload, timeout_s)
+        try:
+            return future.result(timeout=0.25)
+        except FuturesTimeoutError:
             return False
 
+    def _do_send(self, payload: bytes, timeout_s: float) -> bool:
+        """Write an already-encoded IPC payload (runs on the mpv-ipc thread)."""
+        with self._ipc_lock:
+            # Retry once: a stale socket (mpv restarted) raises on send,
+            # in which case we reconnect and try again.
+            for _ in range(2):
+                sock = self._get_ipc_sock(timeout_s)
+                if sock is None:
+                    return False
+                try:
+                    sock.sendall(payload)
+                    return True
+                except OSError:
+                    self._drop_ipc_sock()
+        return False
+
+    def _send_ipc_command(self, command: list, timeout_s: float = 1.5) -> bool:
+        """Send a command to MPV via IPC socket"""
+        payload = _json_dumps({"command": command}) + b'\n'
+        return self._send_raw(payload, timeout_s)
+
+    def _send_ipc_batch(self, commands: list, timeout_s: float = 1.5) -> bool:
+        """Send several commands to MPV in a single write.
+
+        mpv's IPC protocol is newline-delimited JSON, so a compound
+        operation (e.g. pause + seek + volume) can be framed into one
+        buffer and shipped with one sendall instead of N.
+        """
+        if not commands:
+            return True
+        payload = b"".join(
+            _json_dumps({"command": command}) + b'\n'
+            for command in commands
+        )
+        return self._send_raw(payload, timeout_s)
+
     def _send_ipc_quit(self, timeout_s: float = 1.5) -> bool:
-        return self._send_ipc_command(["quit"], timeout_s)
+        return self._send_raw(self._PAYLOAD_QUIT, timeout_s)
 
     def play_pause(self) -> bool:
         """Toggle play/pause"""
-        return self._send_ipc_command(["cycle", "pause"])
+        return self._send_raw(self._PAYLOAD_PAUSE_TOGGLE)
 
     def next_video(self) -> bool:
         """Go to next video in playlist"""
-        return self._send_ipc_command(["playlist_next"])
+        return self._send_raw(self._PAYLOAD_NEXT)
 
     def previous_video(self) -> bool:
         """Go to previous video in playlist"""
-        return self._send_ipc_command(["playlist_prev"])
+        return self._send_raw(self._PAYLOAD_PREV)
 
     def seek_forward(self, seconds: int = 30) -> bool:
         """Seek forward by specified seconds"""
-        return self._send_ipc_command(["seek", seconds])
+        return self._send_raw(f'{{"command": ["seek", {int(seconds)}]}}\n'.encode("utf-8"))
 
     def seek_backward(self, seconds: int = 30) -> bool:
         """Seek backward by specified seconds"""
-        return self._send_ipc_command(["seek", -seconds])
+        return self._send_raw(f'{{"command": ["seek", {-int(seconds)}]}}\n'.encode("utf-8"))
 
     def set_volume(self, volume: int) -> bool:
         """Set volume (0-100)"""
-        return self._send_ipc_command(["set", "volume", volume])
+        return self._send_raw(f'{{"command": ["set", "volume", {int(volume)}]}}\n'.encode("utf-8"))
 
     def pause(self) -> bool:
-        return self._send_ipc_command(["set", "pause", True])
+        return self._send_raw(self._PAYLOAD_PAUSE_ON)
 
     def resume(self) -> bool:
-        return self._send_ipc_command(["set", "pause", False])
+        return self._send_raw(self._PAYLOAD_PAUSE_OFF)
 
     def mute(self) -> bool:
-        return self._send_ipc_command(["set", "mute", True])
+        return self._send_raw(self._PAYLOAD_MUTE_ON)
 
     def unmute(self) -> bool:
-        return self._send_ipc_command(["set", "mute", False])
+        return self._send_raw(self._PAYLOAD_MUTE_OFF)
 
     def load_file(self, path: str) -> bool:
         """Replace current playback with given file"""
@@ -134,12 +333,9 @@ class MpvProcessManager(QtCore.QObject):
 
         try:
             if sent_quit:
-                # give mpv a moment to exit cleanly
-                for _ in range(15):
-                    ret = self._process.poll()
-                    if ret is not None:
-                        break
-                    time.sleep(0.1)
+                # give mpv a moment to exit cleanly; the pidfd wait wakes
+                # the instant the child exits
+                _wait_for_exit(self._process, 1.5)
             # if still running, terminate
             if self._process.poll() is None:
                 self._process.terminate()
@@ -150,9 +346,17 @@ class MpvProcessManager(QtCore.QObject):
         finally:
             self._process = None
             # Best-effort cleanup
+            with self._ipc_lock:
+                self._drop_ipc_sock()
             self._cleanup_ipc_socket()
 
 
+@lru_cache(maxsize=32)
+def _load_pixmap(path: str) -> QtGui.QPixmap:
+    """Decode an overlay image once; recurring ad creatives hit the cache."""
+    return QtGui.QPixmap(path)
+
+
 class OverlayBanner(QtWidgets.QFrame):
     """
     Banner widget to render text (static or scrolling) or image/GIF.
@@ -168,36 +372,34 @@ class OverlayBanner(QtWidgets.QFrame):
         self.setPalette(palette)
         self.setFrameShape(QtWidgets.QFrame.NoFrame)
 
-        self._stack = QtWidgets.QStackedWidget(self)
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._stack)
-
-        # Text view
-        self._text_container = QtWidgets.QWidget(self)
-        text_layout = QtWidgets.QHBoxLayout(self._text_container)
-        text_layout.setContentsMargins(12, 6, 12, 6)
-        self._text_label = QtWidgets.QLabel(self._text_container)
-        self._text_label.setStyleSheet("color: white; font-size: 20px;")
-        self._text_label.setWordWrap(False)
-        text_layout.addWidget(self._text_label)
-
-        # Image view (supports GIF via QMovie)
-        self._image_container = QtWidgets.QWidget(self)
-        img_layout = QtWidgets.QHBoxLayout(self._image_container)
-        img_layout.setContentsMargins(0, 0, 0, 0)
-        self._image_label = QtWidgets.QLabel(self._image_container)
-        self._image_label.setAlignment(QtCore.Qt.AlignCenter)
-        img_layout.addWidget(self._image_label)
-
-        self._stack.addWidget(self._text_container)
-        self._stack.addWidget(self._image_container)
-
-        # Marquee timer
-        self._marquee_timer = QtCore.QTimer(self)
-        self._marquee_timer.timeout.connect(self._tick_marquee)
-        self._marquee_enabled = False
-        self._marquee_pos = 0
+        # One label renders text, pixmap, and GIF alike (setText/setPixmap/
+        # setMovie clear each other): far fewer widgets to style, paint,
+        # and relayout than the old stacked containers. No layout on
+        # purpose — the marquee needs the label sized to the full text
+        # width, which a layout would clamp to the banner
+        self._label = QtWidgets.QLabel(self)
+        self._label.setStyleSheet("color: white; font-size: 20px;")
+        self._label.setWordWrap(False)
+        self._label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+
+        # Source pixmap plus a scaled copy cached against the banner
+        # size, so a resize that does not change geometry rescales
+        # nothing (and scaling keeps the aspect ratio, unlike
+        # setScaledContents)
+        self._source_pixmap: Optional[QtGui.QPixmap] = None
+        self._scaled_pixmap: Optional[QtGui.QPixmap] = None
+        self._scaled_for: Optional[QtCore.QSize] = None
+
+        # One QMovie reused across ads; CacheAll keeps decoded GIF frames
+        # so looping does not re-decode
+        self._movie = QtGui.QMovie(self)
+        self._movie.setCacheMode(QtGui.QMovie.CacheAll)
+
+        # Marquee animation: moving the label uses the compositor fast
+        # path, unlike restyling via stylesheet on a timer tick
+        self._scroll_anim = QtCore.QPropertyAnimation(self._label, b"pos", self)
+        self._scroll_anim.setEasingCurve(QtCore.QEasingCurve.Linear)
+        self._scroll_anim.setLoopCount(-1)
 
         # Auto-hide timer
         self._autohide_timer = QtCore.QTimer(self)
@@ -207,54 +409,74 @@ class OverlayBanner(QtWidgets.QFrame):
         self.hide()
 
     def show_text(self, text: str, scroll: bool = False, duration_s: Optional[int] = None) -> None:
-        self._stack.setCurrentWidget(self._text_container)
-        self._text_label.setText(text)
-        self._marquee_enabled = scroll
-        self._marquee_pos = 0
+        self._scroll_anim.stop()
+        self._movie.stop()
+        self._source_pixmap = None
+        self._label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        self._label.setText(text)
         if scroll:
-            self._marquee_timer.start(30)
+            # Text width is computed once here, not per animation frame.
+            # The label is resized to the full text so QLabel never
+            # clips it; the whole string scrolls through the banner.
+            # ensurePolished so the metrics reflect the stylesheet font
+            self._label.ensurePolished()
+            text_width = self._label.fontMetrics().horizontalAdvance(text) + 100
+            self._label.resize(text_width, self.height())
+            self._scroll_anim.setStartValue(QtCore.QPoint(self.width(), 0))
+            self._scroll_anim.setEndValue(QtCore.QPoint(-text_width, 0))
+            # 15 ms per pixel matches the old timer's 2 px / 30 ms speed
+            self._scroll_anim.setDuration(max(1, (self.width() + text_width) * 15))
+            self._scroll_anim.start()
         else:
-            self._marquee_timer.stop()
+            self._label.setGeometry(self.rect())
         self._set_autohide(duration_s)
         self.show()
         self.update()
 
     def show_image(self, path: str, duration_s: Optional[int] = 10) -> None:
+        self._scroll_anim.stop()
+        self._label.setGeometry(self.rect())
+        self._label.setAlignment(QtCore.Qt.AlignCenter)
         if path.lower().endswith((".gif",)):
-            movie = QtGui.QMovie(path)
-            self._image_label.setMovie(movie)
-            movie.start()
+            self._source_pixmap = None
+            self._movie.stop()
+            self._movie.setFileName(path)
+            # Played at natural size, as before the shared-movie change
+            self._label.setMovie(self._movie)
+            self._movie.start()
         else:
-            pix = QtGui.QPixmap(path)
+            pix = _load_pixmap(path)
             if not pix.isNull():
-                self._image_label.setPixmap(
-                    pix.scaled(self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                )
-        self._stack.setCurrentWidget(self._image_container)
-        self._marquee_timer.stop()
+                self._source_pixmap = pix
+                self._scaled_for = None
+                self._apply_pixmap()
         self._set_autohide(duration_s)
         self.show()
         self.update()
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # type: ignore[name-defined]
-        if self._stack.currentWidget() is self._image_container and self._image_label.pixmap() is not None:
-            pix = self._image_label.pixmap()
-            if pix is not None:
-                self._image_label.setPixmap(
-                    pix.scaled(self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                )
+        # The label has no layout; keep it tracking the banner unless
+        # the marquee is mid-flight with its own geometry
+        if self._scroll_anim.state() != QtCore.QAbstractAnimation.Running:
+            self._label.setGeometry(self.rect())
+        self._apply_pixmap()
         return super().resizeEvent(event)
 
-    def _tick_marquee(self) -> None:
-        if not self._marquee_enabled:
+    def _apply_pixmap(self) -> None:
+        """Fit the source pixmap to the banner, keeping aspect ratio.
+
+        The scaled copy is cached against the banner size, so resizes
+        that do not change geometry rescale nothing.
+        """
+        if self._source_pixmap is None:
             return
-        text = self._text_label.text()
-        metrics = self._text_label.fontMetrics()
-        text_width = metrics.horizontalAdvance(text) + 100
-        self._marquee_pos = (self._marquee_pos + 2) % max(1, text_width)
-        self._text_label.setStyleSheet(
-            f"color: white; font-size: 20px; margin-left: {-self._marquee_pos}px;"
-        )
+        size = self.size()
+        if self._scaled_pixmap is None or self._scaled_for != size:
+            self._scaled_pixmap = self._source_pixmap.scaled(
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+            self._scaled_for = QtCore.QSize(size)
+        self._label.setPixmap(self._scaled_pixmap)
 
     def _set_autohide(self, duration_s: Optional[int]) -> None:
         self._autohide_timer.stop()
@@ -264,187 +486,292 @@ class OverlayBanner(QtWidgets.QFrame):
 
 class UiBridge(QtCore.QObject):
     showOverlayRequested = QtCore.pyqtSignal(dict)
-    hideOverlayRequested = QtCore.pyqtSignal(object)
+    # str rather than object: typed signals skip PyObject boxing through
+    # the queued-connection event ("" means hide all)
+    hideOverlayRequested = QtCore.pyqtSignal(str)
     menuCommandRequested = QtCore.pyqtSignal(str)
+    playInterruptAdRequested = QtCore.pyqtSignal(str)
 
 
 class MediaPlayerAPI:
     """REST API server for controlling the media player"""
     
-    def __init__(self, mpv_manager: MpvProcessManager, bridge: UiBridge, port: int = 5000):
+    def __init__(self, mpv_manager: MpvProcessManager, bridge: UiBridge, port: int = 5000,
+                 socket_path: Optional[str] = None):
         self.mpv_manager = mpv_manager
         self.bridge = bridge
         self.app = Flask(__name__)
         self.port = port
+        # When set, listen on a Unix-domain socket instead of TCP. Local
+        # callers then skip the loopback TCP stack entirely.
+        self.socket_path = socket_path
         self._setup_routes()
     
     def _setup_routes(self):
         """Set up all API routes"""
-        
+
+        # Responses for the fixed-shape action routes, encoded once; the
+        # handlers then just pick success/failure bytes
+        action_responses = {
+            action: (_json_dumps({"success": True, "action": action}),
+                     _json_dumps({"success": False, "action": action}))
+            for action in ("play", "pause", "next", "previous", "mute", "unmute")
+        }
+
+        def _action_response(action: str, success: bool) -> Response:
+            ok, fail = action_responses[action]
+            return Response(ok if success else fail, mimetype='application/json')
+
         @self.app.route('/api/play', methods=['POST'])
         def play():
-            """Start or resume playback"""
-            success = self.mpv_manager.play_pause()
-            return jsonify({"success": success, "action": "play"})
-        
-        @self.app.route('/api/pause', methods=['POST'])
-        def pause():
-            """Pause playback"""
+            """Start/resume or pause playback (both map to mpv's pause toggle)"""
             success = self.mpv_manager.play_pause()
-            return jsonify({"success": success, "action": "pause"})
-        
+            action = "pause" if request.path.endswith("/pause") else "play"
+            return _action_response(action, success)
+
+        # Same toggle behind both paths; one view function keeps the
+        # Werkzeug URL map (and per-request match cost) smaller
+        self.app.add_url_rule('/api/pause', 'pause', play, methods=['POST'])
+
         @self.app.route('/api/next', methods=['POST'])
         def next_video():
             """Go to next video in playlist"""
-            success = self.mpv_manager.next_video()
-            return jsonify({"success": success, "action": "next"})
-        
+            return _action_response("next", self.mpv_manager.next_video())
+
         @self.app.route('/api/previous', methods=['POST'])
         def previous_video():
             """Go to previous video in playlist"""
-            success = self.mpv_manager.previous_video()
-            return jsonify({"success": success, "action": "previous"})
+            return _action_response("previous", self.mpv_manager.previous_video())
         
+        def _seek_seconds() -> Optional[int]:
+            # Fast path: ?s=N avoids reading and JSON-parsing a body on
+            # every scrub event; the JSON body stays as a fallback.
+            # Read the raw param so "absent" (fall through to the body)
+            # and "unparseable" (400) are distinct cases.
+            raw = request.args.get('s')
+            if raw is None:
+                data = request.get_json(silent=True, cache=False) or {}
+                raw = data.get('seconds', 30)
+            # Mirror the volume handler: 400 on a non-number instead of
+            # letting int() raise into a 500
+            try:
+                return int(raw)
+            except (TypeError, ValueError):
+                return None
+
         @self.app.route('/api/seek-forward', methods=['POST'])
         def seek_forward():
             """Seek forward by specified seconds"""
-            data = request.get_json() or {}
-            seconds = data.get('seconds', 30)
+            seconds = _seek_seconds()
+            if seconds is None:
+                return _json_response({"success": False, "error": "Seconds must be a number"}, status=400)
             success = self.mpv_manager.seek_forward(seconds)
-            return jsonify({"success": success, "action": "seek_forward", "seconds": seconds})
-        
+            return _json_response({"success": success, "action": "seek_forward", "seconds": seconds})
+
         @self.app.route('/api/seek-backward', methods=['POST'])
         def seek_backward():
             """Seek backward by specified seconds"""
-            data = request.get_json() or {}
-            seconds = data.get('seconds', 30)
+            seconds = _seek_seconds()
+            if seconds is None:
+                return _json_response({"success": False, "error": "Seconds must be a number"}, status=400)
             success = self.mpv_manager.seek_backward(seconds)
-            return jsonify({"success": success, "action": "seek_backward", "seconds": seconds})
+            return _json_response({"success": success, "action": "seek_backward", "seconds": seconds})
         
         @self.app.route('/api/volume', methods=['POST'])
         def set_volume():
             """Set volume (0-100)"""
             data = request.get_json() or {}
-            volume = data.get('volume', 50)
-            if not isinstance(volume, int) or volume < 0 or volume > 100:
-                return jsonify({"success": False, "error": "Volume must be between 0 and 100"}), 400
+            # Clamp instead of branching on range; 400 only on a non-number
+            try:
+                volume = max(0, min(100, int(data.get('volume', 50))))
+            except (TypeError, ValueError):
+                return _json_response({"success": False, "error": "Volume must be a number between 0 and 100"}, status=400)
             success = self.mpv_manager.set_volume(volume)
-            return jsonify({"success": success, "action": "set_volume", "volume": volume})
+            return _json_response({"success": success, "action": "set_volume", "volume": volume})
 
         @self.app.route('/api/mute', methods=['POST'])
         def api_mute():
-            success = self.mpv_manager.mute()
-            return jsonify({"success": success, "action": "mute"})
+            return _action_response("mute", self.mpv_manager.mute())
 
         @self.app.route('/api/unmute', methods=['POST'])
         def api_unmute():
-            success = self.mpv_manager.unmute()
-            return jsonify({"success": success, "action": "unmute"})
+            return _action_response("unmute", self.mpv_manager.unmute())
         
+        @self.app.route('/api/batch', methods=['POST'])
+        def batch():
+            """Send multiple raw MPV commands in a single IPC write"""
+            data = request.get_json() or {}
+            commands = data.get('commands')
+            if not isinstance(commands, list) or not all(isinstance(c, list) for c in commands):
+                return _json_response({"success": False, "error": "commands must be a list of command lists"}, status=400)
+            success = self.mpv_manager._send_ipc_batch(commands)
+            return _json_response({"success": success, "action": "batch", "count": len(commands)})
+
+        # The status response shape is fixed; pre-encode everything except
+        # the one dynamic field so the heartbeat endpoint skips jsonify
+        status_tmpl = (
+            b'{"success": true, "status": "running", "ipc_socket": "'
+            + IPC_SOCKET_PATH.encode("utf-8")
+            + b'", "socket_exists": %s}'
+        )
+
+        # socket_exists is only a monitoring hint; refresh the stat at most
+        # once per second instead of once per poll
+        status_cache = {"at": 0.0, "exists": b'false'}
+        status_cache_lock = threading.Lock()
+
         @self.app.route('/api/status', methods=['GET'])
         def status():
             """Get player status"""
-            return jsonify({
-                "success": True,
-                "status": "running",
-                "ipc_socket": IPC_SOCKET_PATH,
-                "socket_exists": os.path.exists(IPC_SOCKET_PATH)
-            })
+            now = time.monotonic()
+            with status_cache_lock:
+                if now - status_cache["at"] >= 1.0:
+                    status_cache["exists"] = (
+                        b'true' if os.path.exists(IPC_SOCKET_PATH) else b'false'
+                    )
+                    status_cache["at"] = now
+                exists = status_cache["exists"]
+            return Response(status_tmpl % exists, mimetype='application/json')
 
         @self.app.route('/show-overlay', methods=['POST'])
         def show_overlay():
             data = request.get_json() or {}
             # Expected: position: bottom|side, type: image|text, content: path or text, optional duration, scroll
             self.bridge.showOverlayRequested.emit(data)
-            return jsonify({"success": True})
+            return _json_response({"success": True})
 
         @self.app.route('/hide-overlay', methods=['POST'])
         def hide_overlay():
             data = request.get_json() or {}
-            position = data.get('position')  # None, 'bottom', or 'side'
-            self.bridge.hideOverlayRequested.emit(position)
-            return jsonify({"success": True})
+            position = data.get('position')  # None/'', 'bottom', or 'side'
+            # The signal is typed str; reject anything else instead of
+            # letting .emit() raise into a 500
+            if position is not None and not isinstance(position, str):
+                return _json_response({"success": False, "error": "Position must be a string"}, status=400)
+            self.bridge.hideOverlayRequested.emit(position or "")
+            return _json_response({"success": True})
 
         @self.app.route('/play-interrupt-ad', methods=['POST'])
         def play_interrupt_ad():
             data = request.get_json() or {}
             ad_file = data.get('file')
             if not ad_file or not os.path.exists(ad_file):
-                return jsonify({"success": False, "error": "Ad file not found"}), 400
-            # Emit signal to UI/main thread to run interrupt ad flow
-            QtCore.QMetaObject.invokeMethod(
-                self.bridge,  # use bridge to hop to UI thread via PlayerWindow method
-                "objectName",
-                QtCore.Qt.QueuedConnection
-            )
-            # Store path globally in app context to be consumed by UI
-            self.app.config['INTERRUPT_AD_FILE'] = ad_file
-            QtCore.QTimer.singleShot(0, lambda: self.bridge.parent().play_interrupt_ad(ad_file) if self.bridge.parent() else None)
-            return jsonify({"success": True})
+                return _json_response({"success": False, "error": "Ad file not found"}, status=400)
+            # One queued signal hops to the UI thread; PlayerWindow runs
+            # the interrupt-ad flow from there
+            self.bridge.playInterruptAdRequested.emit(ad_file)
+            return _json_response({"success": True})
 
         # Menu control (remote-driven backup UI)
         @self.app.route('/menu/open', methods=['POST'])
         def menu_open():
             self.bridge.menuCommandRequested.emit('open')
-            return jsonify({"success": True})
+            return _json_response({"success": True})
 
         @self.app.route('/menu/close', methods=['POST'])
         def menu_close():
             self.bridge.menuCommandRequested.emit('close')
-            return jsonify({"success": True})
+            return _json_response({"success": True})
 
         @self.app.route('/menu/next', methods=['POST'])
         def menu_next():
             self.bridge.menuCommandRequested.emit('next')
-            return jsonify({"success": True})
+            return _json_response({"success": True})
 
         @self.app.route('/menu/prev', methods=['POST'])
         def menu_prev():
             self.bridge.menuCommandRequested.emit('prev')
-            return jsonify({"success": True})
+            return _json_response({"success": True})
 
         @self.app.route('/menu/confirm', methods=['POST'])
         def menu_confirm():
             self.bridge.menuCommandRequested.emit('confirm')
-            return jsonify({"success": True})
+            return _json_response({"success": True})
     
     def start(self, use_production_server=False):
         """Start the API server in a separate thread"""
         def run_server():
-            if use_production_server:
+            if self.socket_path:
+                # Unix-domain socket listener; stale file from a previous
+                # run would make bind() fail
+                try:
+                    os.unlink(self.socket_path)
+                except FileNotFoundError:
+                    pass
+                try:
+                    import bjoern
+                    bjoern.run(self.app, f'unix:{self.socket_path}')
+                    return
+                except ImportError:
+                    pass
+                try:
+                    import waitress
+                    waitress.serve(self.app, unix_socket=self.socket_path,
+                                   threads=4, _quiet=True)
+                except ImportError:
+                    import logging
+                    log = logging.getLogger('werkzeug')
+                    log.setLevel(logging.ERROR)
+                    self.app.run(host=f'unix://{self.socket_path}', port=self.port,
+                                 debug=False, use_reloader=False, threaded=True)
+            elif use_production_server:
                 # Use Gunicorn for production
                 try:
                     import gunicorn.app.wsgiapp as wsgi
-                    sys.argv = ['gunicorn', '--bind', f'0.0.0.0:{self.port}', 
+                    sys.argv = ['gunicorn', '--bind', f'0.0.0.0:{self.port}',
                                '--workers', '1', '--threads', '2', 
                                '--access-logfile', '-', '--error-logfile', '-',
                                '--log-level', 'info', 'player:app']
                     wsgi.run()
                 except ImportError:
                     print("Gunicorn not available, falling back to Flask development server")
-                    self.app.run(host='0.0.0.0', port=self.port, debug=False, use_reloader=False)
+                    self.app.run(host='0.0.0.0', port=self.port, debug=False,
+                                 use_reloader=False, threaded=True)
             else:
-                # Suppress Flask development server warning
-                import logging
-                log = logging.getLogger('werkzeug')
-                log.setLevel(logging.ERROR)
-                
-                self.app.run(host='0.0.0.0', port=self.port, debug=False, use_reloader=False)
+                # Prefer bjoern when available: HTTP parsing and socket I/O
+                # happen in C without holding the GIL, which matters since
+                # our handlers are little more than a sendall
+                try:
+                    import bjoern
+                    bjoern.run(self.app, '0.0.0.0', self.port)
+                    return
+                except ImportError:
+                    pass
+                # waitress: threaded WSGI pool, no dev-server warning, no
+                # head-of-line blocking behind a single worker
+                try:
+                    import waitress
+                    waitress.serve(self.app, host='0.0.0.0', port=self.port,
+                                   threads=4, _quiet=True)
+                except ImportError:
+                    # Suppress Flask development server warning
+                    import logging
+                    log = logging.getLogger('werkzeug')
+                    log.setLevel(logging.ERROR)
+
+                    # threaded=True: handle requests concurrently so one slow
+                    # IPC send cannot stall every other control-plane call.
+                    self.app.run(host='0.0.0.0', port=self.port, debug=False,
+                                 use_reloader=False, threaded=True)
         
-        api_thread = threading.Thread(target=run_server, daemon=True)
+        api_thread = threading.Thread(target=run_server, daemon=True, name='api-server')
         api_thread.start()
         server_type = "production (Gunicorn)" if use_production_server else "development (Flask)"
-        print(f"API server started on http://0.0.0.0:{self.port} ({server_type})")
+        if self.socket_path:
+            print(f"API server started on unix://{self.socket_path} ({server_type})")
+        else:
+            print(f"API server started on http://0.0.0.0:{self.port} ({server_type})")
         return api_thread
 
 
 class PlayerWindow(QtWidgets.QMainWindow):
-    def __init__(self, media_dir: str, api_port: int = 5000, use_production_server: bool = False, demo_overlays: bool = False) -> None:
+    def __init__(self, media_dir: str, api_port: int = 5000, use_production_server: bool = False, demo_overlays: bool = False, api_socket: Optional[str] = None) -> None:
         super().__init__()
         self.media_dir = media_dir
         self.mpv_manager = MpvProcessManager(self)
         self.bridge = UiBridge()
         self.api_port = api_port
+        self.api_socket = api_socket
         self.use_production_server = use_production_server
         self.api_server = None
         self.demo_overlays = demo_overlays
@@ -592,10 +919,22 @@ class PlayerWindow(QtWidgets.QMainWindow):
         self.showFullScreen()
         QtCore.QTimer.singleShot(0, self._start_mpv_once_visible)
 
+        # Coalesce bursts of /show-overlay updates: keep only the newest
+        # payload per position and apply at most once per frame (~16 ms)
+        self._pending_overlay: dict = {}
+        self._overlay_timers: dict = {}
+        for pos in ("bottom", "side"):
+            overlay_timer = QtCore.QTimer(self)
+            overlay_timer.setSingleShot(True)
+            overlay_timer.setInterval(16)
+            overlay_timer.timeout.connect(lambda p=pos: self._apply_pending_overlay(p))
+            self._overlay_timers[pos] = overlay_timer
+
         # Bridge: connect API thread signals to UI handlers
         self.bridge.showOverlayRequested.connect(self._on_show_overlay)
         self.bridge.hideOverlayRequested.connect(self._on_hide_overlay)
         self.bridge.menuCommandRequested.connect(self._on_menu_command)
+        self.bridge.playInterruptAdRequested.connect(self.play_interrupt_ad)
 
     def _start_mpv_once_visible(self) -> None:
         # Ensure native window is created
@@ -606,8 +945,8 @@ class PlayerWindow(QtWidgets.QMainWindow):
         wid = int(self.video_host.winId())
         self.mpv_manager.start(wid=wid, media_dir=self.media_dir)
         
-        # Start the API server after MPV is running
-        QtCore.QTimer.singleShot(2000, self._start_api_server)  # Wait 2 seconds for MPV to start
+        # Start the API server as soon as mpv has created its IPC socket
+        self._watch_for_ipc()
         # Optional: start demo overlays shortly after start
         if self.demo_overlays:
             QtCore.QTimer.singleShot(3000, self._demo_show_overlays)
@@ -615,9 +954,56 @@ class PlayerWindow(QtWidgets.QMainWindow):
         # Show controls briefly on startup
         self._show_controls_temporarily()
     
+    def _watch_for_ipc(self) -> None:
+        """Start the API the instant mpv creates its IPC socket.
+
+        Watches the socket's directory (inotify under the hood) so no
+        timer has to fire at all; falls back to backoff polling if the
+        watch cannot be established.
+        """
+        # Deadline fallback: if the socket never appears (mpv died
+        # during init, bad media dir), start the API anyway so the
+        # control plane stays reachable. _on_ipc_ready guards against
+        # double starts, so this is a no-op on the happy path.
+        QtCore.QTimer.singleShot(5000, self._on_ipc_ready)
+        if os.path.exists(IPC_SOCKET_PATH):
+            self._on_ipc_ready()
+            return
+        watcher = QtCore.QFileSystemWatcher(self)
+        watch_dir = os.path.dirname(IPC_SOCKET_PATH) or "/"
+        if watcher.addPath(watch_dir):
+            self._ipc_watcher = watcher
+            watcher.directoryChanged.connect(self._on_ipc_dir_changed)
+            # Re-check: the socket may have appeared before the watch did
+            self._on_ipc_dir_changed(watch_dir)
+        else:
+            self._poll_for_ipc(attempt=0)
+
+    def _on_ipc_dir_changed(self, path: str) -> None:
+        if not os.path.exists(IPC_SOCKET_PATH):
+            return
+        self._ipc_watcher.removePath(path)
+        self._on_ipc_ready()
+
+    def _poll_for_ipc(self, attempt: int) -> None:
+        """Fallback: poll for the IPC socket (1, 2, 4, ... 500 ms)"""
+        if os.path.exists(IPC_SOCKET_PATH):
+            self._on_ipc_ready()
+            return
+        delay_ms = min(500, 1 << attempt)
+        QtCore.QTimer.singleShot(delay_ms, lambda: self._poll_for_ipc(attempt + 1))
+
+    def _on_ipc_ready(self) -> None:
+        if self.api_server is not None:
+            return  # watcher and recheck can race; only start once
+        # Pre-connect so the first command skips the connect handshake
+        self.mpv_manager.connect_ipc()
+        self._start_api_server()
+
     def _start_api_server(self) -> None:
         """Start the REST API server"""
-        self.api_server = MediaPlayerAPI(self.mpv_manager, self.bridge, self.api_port)
+        self.api_server = MediaPlayerAPI(self.mpv_manager, self.bridge, self.api_port,
+                                         socket_path=self.api_socket)
         self.api_server.start(self.use_production_server)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[name-defined]
@@ -636,6 +1022,18 @@ class PlayerWindow(QtWidgets.QMainWindow):
 
     # ===== Overlay controls on UI thread =====
     def _on_show_overlay(self, payload: dict) -> None:
+        # Stash only the most recent payload per position; a spamming
+        # client then costs one applied update per frame at most
+        key = "bottom" if payload.get("position", "bottom") == "bottom" else "side"
+        self._pending_overlay[key] = payload
+        overlay_timer = self._overlay_timers[key]
+        if not overlay_timer.isActive():
+            overlay_timer.start()
+
+    def _apply_pending_overlay(self, key: str) -> None:
+        payload = self._pending_overlay.pop(key, None)
+        if payload is None:
+            return
         position = payload.get("position", "bottom")
         ad_type = payload.get("type", "text")
         content = payload.get("content", "")
@@ -655,12 +1053,11 @@ class PlayerWindow(QtWidgets.QMainWindow):
         else:
             target.show_image(str(content), duration_s=duration if duration is not None else 10)
         target.show()
-        # Ensure stacking and layout update (overlays are native so they sit above mpv child window)
+        # Ensure stacking (overlays are native so they sit above the mpv
+        # child window); show()/setFixedHeight already dirty the layout,
+        # so no manual invalidate/update is needed
         target.raise_()
         self.video_host.lower()
-        self.outer_v.invalidate()
-        self.outer_v.update()
-        target.update()
 
     def _demo_show_overlays(self) -> None:
         # Show a side image ad and a bottom ticker like TV
@@ -680,8 +1077,8 @@ class PlayerWindow(QtWidgets.QMainWindow):
             "duration": 20,
         })
 
-    def _on_hide_overlay(self, position: Optional[str]) -> None:
-        if position is None:
+    def _on_hide_overlay(self, position: str) -> None:
+        if not position:
             self.bottom_overlay.hide()
             self.right_overlay.hide()
         elif position == "bottom":
@@ -805,40 +1202,33 @@ class PlayerWindow(QtWidgets.QMainWindow):
     def play_interrupt_ad(self, ad_path: str) -> None:
         # Pause main playback
         self.mpv_manager.pause()
-        # Launch a separate mpv in fullscreen on top for the ad
+        # Launch a separate mpv in fullscreen on top for the ad. QProcess
+        # delivers finished() on the UI thread via the Qt event loop, so
+        # no waiter thread or cross-thread hop is needed to resume.
         args = [
-            "mpv",
             ad_path,
             "--fullscreen=yes",
-            "--keep-open=no",
-            "--idle=no",
-            "--no-osd-bar",
-            "--no-input-default-bindings",
-            "--no-input-vo-keyboard",
-            # Show cursor during interrupt ad
-            # (avoid --no-input-cursor and autohide)
-            "--vo=x11",
-            "--hwdec=no",
+            # Cursor stays visible during the interrupt ad
+            # (no --no-input-cursor / autohide here)
+            *_mpv_common_args(),
             "--speed=1",
             "--quiet",
             "--really-quiet",
         ]
-        ad_proc = subprocess.Popen(
-            args,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-            stdin=subprocess.DEVNULL,
-            close_fds=True,
-        )
-
-        # Poll until ad process exits, then resume main
-        def _wait_and_resume():
-            ad_proc.wait()
-            # Hide any overlays that might have been shown for the ad
-            QtCore.QTimer.singleShot(0, lambda: self._on_hide_overlay(None))
-            self.mpv_manager.resume()
-
-        threading.Thread(target=_wait_and_resume, daemon=True).start()
+        proc = QtCore.QProcess(self)
+        proc.setStandardInputFile(QtCore.QProcess.nullDevice())
+        proc.setStandardOutputFile(QtCore.QProcess.nullDevice())
+        proc.setStandardErrorFile(QtCore.QProcess.nullDevice())
+        proc.finished.connect(self._on_ad_finished)
+        # Keep a reference so the QProcess outlives this call
+        self._ad_proc = proc
+        proc.start(_resolve_mpv() or "mpv", args)
+
+    def _on_ad_finished(self, exit_code: int, exit_status: QtCore.QProcess.ExitStatus) -> None:
+        # Hide any overlays that might have been shown for the ad
+        self._on_hide_overlay("")
+        self.mpv_manager.resume()
+        self._ad_proc = None
 
 
 @click.command()
@@ -854,6 +1244,12 @@ class PlayerWindow(QtWidgets.QMainWindow):
     type=int,
     help="Port for the REST API server (default: 5000).",
 )
+@click.option(
+    "--api-socket",
+    default=None,
+    type=str,
+    help="Unix socket path for the REST API; overrides --api-port when set.",
+)
 @click.option(
     "--production-server",
     is_flag=True,
@@ -864,13 +1260,13 @@ class PlayerWindow(QtWidgets.QMainWindow):
     is_flag=True,
     help="Show a demo side image ad and bottom ticker automatically.",
 )
-def main(media_dir: str, api_port: int, production_server: bool, demo_overlays: bool) -> None:
+def main(media_dir: str, api_port: int, api_socket: Optional[str], production_server: bool, demo_overlays: bool) -> None:
     # Qt Application
     app = QtWidgets.QApplication(sys.argv)
     # Make sure our central widget uses native windowing for --wid embedding
     app.setQuitOnLastWindowClosed(True)
 
-    window = PlayerWindow(media_dir=media_dir, api_port=api_port, use_production_server=production_server, demo_overlays=demo_overlays)
+    window = PlayerWindow(media_dir=media_dir, api_port=api_port, use_production_server=production_server, demo_overlays=demo_overlays, api_socket=api_socket)
     window.show()
     sys.exit(app.exec_())
 
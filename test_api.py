@@ -10,14 +10,18 @@ import json
 
 API_BASE = "http://localhost:5000/api"
 
+# One session for the whole run: keep-alive reuses the TCP connection
+# instead of handshaking per request
+SESSION = requests.Session()
+
 def test_endpoint(method, endpoint, data=None):
     """Test an API endpoint and print results"""
     url = f"{API_BASE}{endpoint}"
     try:
         if method == "GET":
-            response = requests.get(url, timeout=5)
+            response = SESSION.get(url, timeout=5)
         else:
-            response = requests.post(url, json=data, timeout=5)
+            response = SESSION.post(url, json=data, timeout=5)
         
         print(f"{method} {endpoint}: {response.status_code}")
         if response.status_code == 200: